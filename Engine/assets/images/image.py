@@ -1,15 +1,32 @@
+import asyncio
+import functools
+import os
+import struct
+
+# Width and height are consecutive signed 32-bit little-endian ints
+_BMP_SIZE = struct.Struct('<ii')
+
 def get_bmp_dimensions(filepath):
+    # Keyed on the absolute path, ns mtime and size so an edited BMP is
+    # re-read instead of served stale
+    stat = os.stat(filepath)
+    return _read_bmp_dimensions(
+        os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+
+@functools.lru_cache(maxsize=512)
+def _read_bmp_dimensions(filepath, mtime_ns, size):
     with open(filepath, 'rb') as bmp_file:
         bmp_file.seek(18)  # The width starts at byte 18 in the BMP file header
-        width_bytes = bmp_file.read(4)
-        height_bytes = bmp_file.read(4)
-        
-        # Convert bytes to integers (little-endian format)
-        width = int.from_bytes(width_bytes, byteorder='little')
-        height = int.from_bytes(height_bytes, byteorder='little')
+        width, height = _BMP_SIZE.unpack(bmp_file.read(8))
         return width, height
 
-# Example usage
-bmp_filepath = 'coins.bmp'  # Replace with your BMP file path
-width, height = get_bmp_dimensions(bmp_filepath)
-print(f"Dimensions of the BMP file: {width}x{height}")
+async def get_bmp_dimensions_many(filepaths):
+    # Parse headers concurrently when scanning a whole asset folder
+    return await asyncio.gather(
+        *(asyncio.to_thread(get_bmp_dimensions, path) for path in filepaths))
+
+if __name__ == "__main__":
+    # Example usage
+    bmp_filepath = 'coins.bmp'  # Replace with your BMP file path
+    width, height = get_bmp_dimensions(bmp_filepath)
+    print(f"Dimensions of the BMP file: {width}x{height}")